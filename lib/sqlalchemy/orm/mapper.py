@@ -4079,6 +4079,23 @@ def _dispose_registries(registries: Set[_RegistryType], cascade: bool) -> None:
         reg._new_mappers = False
 
 
+def _is_disposed(reg: _RegistryType) -> bool:
+    """Return True if the given registry has no state for
+    _dispose_registries() to reset.
+
+    This is kept alongside _dispose_registries() so that the two remain
+    in sync.
+
+    """
+    return not (
+        reg._managers
+        or reg._non_primary_mappers
+        or reg._dependents
+        or reg._dependencies
+        or reg._new_mappers
+    )
+
+
 def reconstructor(fn):
     """Decorate a method as the 'reconstructor' hook.
 
@@ -16,6 +16,7 @@ import sys
 import sqlalchemy as sa
 from . import assertions
 from . import config
+from . import engines
 from . import schema
 from .assertions import eq_
 from .assertions import ne_
@@ -25,12 +26,21 @@ from .entities import ComparableMixin  # noqa
 from .util import adict
 from .util import drop_all_tables_from_metadata
 from .. import event
+from .. import func
+from .. import Integer
+from .. import select
+from .. import testing
 from .. import util
 from ..orm import DeclarativeBase
 from ..orm import events as orm_events
 from ..orm import MappedAsDataclass
+from ..orm import mapperlib
 from ..orm import registry
+from ..schema import Column
+from ..schema import Computed
+from ..schema import CreateTable
 from ..schema import sort_tables_and_constraints
+from ..schema import Table
 from ..sql import visitors
 from ..sql.elements import ClauseElement
 
@@ -172,31 +182,24 @@ class TestBase:
 
     @config.fixture()
     def testing_engine(self):
-        from . import engines
-
-        def gen_testing_engine(
-            url=None,
-            options=None,
-            future=None,
-            asyncio=False,
-            transfer_staticpool=False,
-            share_pool=False,
-        ):
-            if options is None:
-                options = {}
-            options["scope"] = "fixture"
-            return engines.testing_engine(
-                url=url,
-                options=options,
-                asyncio=asyncio,
-                transfer_staticpool=transfer_staticpool,
-                share_pool=share_pool,
-            )
-
-        yield gen_testing_engine
+        yield _testing_engine_generator("fixture")
 
         engines.testing_reaper._drop_testing_engines("fixture")
 
+    @config.fixture(scope="class")
+    def testing_engine_class(self):
+        """Like :meth:`.testing_engine`, however the engines produced are
+        disposed at the end of the test class rather than after each test.
+
+        Tests which alter the state of the engine, such as by adding event
+        listeners or changing pool state, should use the function-scoped
+        ``testing_engine`` fixture instead.
+
+        """
+        # engines in the "class" scope are disposed by the testing reaper
+        # once the class completes
+        return _testing_engine_generator("class")
+
     @config.fixture()
     def async_testing_engine(self, testing_engine):
         def go(**kw):
@@ -213,9 +216,7 @@ class TestBase:
     def metadata(self, request):
         """Provide bound MetaData for a single test, dropping afterwards."""
 
-        from ..sql import schema
-
-        metadata = schema.MetaData()
+        metadata = sa.MetaData()
         request.instance.metadata = metadata
         yield metadata
         del request.instance.metadata
@@ -233,6 +234,22 @@ class TestBase:
         else:
             drop_all_tables_from_metadata(metadata, config.db)
 
+    @config.fixture(scope="class")
+    def metadata_class(self):
+        """Provide MetaData shared by all tests in a class, dropping
+        afterwards.
+
+        Tables are only dropped once the class is complete, so this is
+        suited to tests which create a set of tables and then only read
+        from them; tests which add to or otherwise mutate the MetaData
+        should continue to use the function-scoped ``metadata`` fixture.
+
+        """
+        metadata = sa.MetaData()
+        yield metadata
+
+        drop_all_tables_from_metadata(metadata, config.db)
+
     @config.fixture(
         params=[
             (rollback, second_operation, begin_nested)
@@ -247,9 +264,6 @@ class TestBase:
     def trans_ctx_manager_fixture(self, request, metadata):
         rollback, second_operation, begin_nested = request.param
 
-        from sqlalchemy import Table, Column, Integer, func, select
-        from . import eq_
-
         t = Table("test", metadata, Column("data", Integer))
         eng = getattr(self, "bind", None) or config.db
 
@@ -381,6 +395,29 @@ class TestBase:
 _connection_fixture_connection = None
 
 
+def _testing_engine_generator(scope):
+    def gen_testing_engine(
+        url=None,
+        options=None,
+        future=None,
+        asyncio=False,
+        transfer_staticpool=False,
+        share_pool=False,
+    ):
+        if options is None:
+            options = {}
+        options["scope"] = scope
+        return engines.testing_engine(
+            url=url,
+            options=options,
+            asyncio=asyncio,
+            transfer_staticpool=transfer_staticpool,
+            share_pool=share_pool,
+        )
+
+    return gen_testing_engine
+
+
 class FutureEngineMixin:
     """alembic's suite still using this"""
 
@@ -464,18 +501,104 @@ class TablesTest(TestBase):
             cls.define_tables(cls._tables_metadata)
             if cls.run_create_tables == "once":
                 cls._tables_metadata.create_all(cls.bind)
-            cls.tables.update(cls._tables_metadata.tables)
-            cls.sequences.update(cls._tables_metadata._sequences)
+            # adict tries each attribute name as a key before falling
+            # back to the dict method; call the methods on dict directly
+            dict.update(cls.tables, cls._tables_metadata.tables)
+            dict.update(cls.sequences, cls._tables_metadata._sequences)
 
     def _setup_each_tables(self):
         if self.run_define_tables == "each":
             self.define_tables(self._tables_metadata)
             if self.run_create_tables == "each":
                 self._tables_metadata.create_all(self.bind)
-            self.tables.update(self._tables_metadata.tables)
-            self.sequences.update(self._tables_metadata._sequences)
+            dict.update(self.tables, self._tables_metadata.tables)
+            dict.update(self.sequences, self._tables_metadata._sequences)
         elif self.run_create_tables == "each":
-            self._tables_metadata.create_all(self.bind)
+            self._create_tables_each()
+
+    @classmethod
+    def _create_tables_each(cls):
+        """Create the tables of ``_tables_metadata`` for
+        run_create_tables="each", where the tables themselves are defined
+        only once.
+
+        The DDL emitted by the first create_all() is recorded and then
+        replayed directly for subsequent tests, skipping both DDL
+        compilation and the "checkfirst" queries.  The recording is only
+        kept if that create_all() created all of the tables; some fixtures,
+        such as :class:`.DeclarativeMappedTest`, may have created them
+        already at class setup.
+
+        The recording is reused only while the same Table objects, with
+        the same number of columns, indexes and constraints, are present;
+        other in-place changes to the tables aren't detected.
+
+        """
+        bind = cls.bind
+        metadata = cls._tables_metadata
+        tables = tuple(
+            (t, len(t.columns), len(t.indexes), len(t.constraints))
+            for t in metadata.tables.values()
+        )
+
+        # DDL event listeners may do things other than emit DDL, and
+        # schema translation is applied per-connection, so these aren't
+        # safe to replay
+        if (
+            metadata.dispatch.before_create
+            or metadata.dispatch.after_create
+            or bind.get_execution_options().get("schema_translate_map")
+            or any(
+                t.dispatch.before_create or t.dispatch.after_create
+                for t, *_ in tables
+            )
+        ):
+            metadata.create_all(bind)
+            return
+
+        cached = cls.__dict__.get("_create_tables_ddl")
+        if (
+            cached is not None
+            and cached[0] is bind
+            and len(cached[1]) == len(tables)
+            and all(
+                a[0] is b[0] and a[1:] == b[1:]
+                for a, b in zip(cached[1], tables)
+            )
+        ):
+            with bind.begin() as conn:
+                for statement in cached[2]:
+                    conn.exec_driver_sql(statement)
+            return
+
+        statements = []
+        created = set()
+        replayable = True
+
+        def capture(conn, cursor, statement, parameters, context, executemany):
+            nonlocal replayable
+
+            # skip the "checkfirst" queries
+            if context is None or not context.isddl:
+                return
+
+            # exec_driver_sql() would not pass on bound parameters
+            if parameters:
+                replayable = False
+            statements.append(statement)
+
+            ddl = context.compiled.statement
+            if isinstance(ddl, CreateTable):
+                created.add(ddl.element)
+
+        with bind.begin() as conn:
+            event.listen(conn, "before_cursor_execute", capture)
+            metadata.create_all(conn)
+
+        if not replayable or any(t not in created for t, *_ in tables):
+            return
+
+        cls._create_tables_ddl = (bind, tables, statements)
 
     def _setup_each_inserts(self):
         if self.run_inserts == "each":
@@ -485,16 +608,12 @@ class TablesTest(TestBase):
 
     def _teardown_each_tables(self):
         if self.run_define_tables == "each":
-            self.tables.clear()
+            dict.clear(self.tables)
             if self.run_create_tables == "each":
-                drop_all_tables_from_metadata(self._tables_metadata, self.bind)
+                _batch_drop_tables(self._tables_metadata, self.bind)
             self._tables_metadata.clear()
         elif self.run_create_tables == "each":
-            drop_all_tables_from_metadata(self._tables_metadata, self.bind)
-
-        savepoints = getattr(config.requirements, "savepoints", False)
-        if savepoints:
-            savepoints = savepoints.enabled
+            _batch_drop_tables(self._tables_metadata, self.bind)
 
         # no need to run deletes if tables are recreated on setup
         if (
@@ -502,41 +621,39 @@ class TablesTest(TestBase):
             and self.run_create_tables != "each"
             and self.run_deletes == "each"
         ):
-            with self.bind.begin() as conn:
-                for table in reversed(
-                    [
-                        t
-                        for (t, fks) in sort_tables_and_constraints(
-                            self._tables_metadata.tables.values()
-                        )
-                        if t is not None
-                    ]
-                ):
-                    try:
-                        if savepoints:
-                            with conn.begin_nested():
-                                conn.execute(table.delete())
-                        else:
-                            conn.execute(table.delete())
-                    except sa.exc.DBAPIError as ex:
-                        print(
-                            ("Error emptying table %s: %r" % (table, ex)),
-                            file=sys.stderr,
-                        )
+            tables = [
+                t
+                for (t, fks) in reversed(self._sort_tables_and_constraints())
+                if t is not None
+            ]
+
+            # without per-test inserts, most tables are typically left
+            # empty by a test, so look for those which aren't first; not
+            # worth the extra round trip where one TRUNCATE empties them all
+            if self.run_inserts != "each" and not _can_batch_truncate(
+                self.bind
+            ):
+                tables = _tables_with_rows(tables, self.bind)
+
+            _batch_truncate(tables, self.bind)
 
     @classmethod
     def _teardown_once_metadata_bind(cls):
         if cls.run_create_tables:
-            drop_all_tables_from_metadata(cls._tables_metadata, cls.bind)
+            _batch_drop_tables(cls._tables_metadata, cls.bind)
 
         if cls.run_dispose_bind == "once":
             cls.dispose_bind(cls.bind)
 
-        cls._tables_metadata.bind = None
-
         if cls.run_setup_bind is not None:
             cls.bind = None
 
+        # don't keep the class's engine and Table objects alive past
+        # its run
+        for attr in ("_create_tables_ddl", "_sorted_tables_and_constraints"):
+            if attr in cls.__dict__:
+                delattr(cls, attr)
+
     @classmethod
     def setup_bind(cls):
         return config.db
@@ -566,34 +683,211 @@ class TablesTest(TestBase):
     def sql_eq_(self, callable_, statements):
         self.assert_sql(self.bind, callable_, statements)
 
+    @classmethod
+    def _sort_tables_and_constraints(cls):
+        """Return sort_tables_and_constraints() for the tables in
+        ``_tables_metadata``, cached on the class for as long as the
+        collection of tables, and the number of foreign key constraints
+        on each, remains the same.
+
+        """
+        tables = tuple(
+            (t, len(t.foreign_key_constraints))
+            for t in cls._tables_metadata.tables.values()
+        )
+
+        cached = cls.__dict__.get("_sorted_tables_and_constraints")
+        if (
+            cached is not None
+            and len(cached[0]) == len(tables)
+            and all(
+                a[0] is b[0] and a[1] == b[1]
+                for a, b in zip(cached[0], tables)
+            )
+        ):
+            return cached[1]
+
+        collection = tuple(
+            sort_tables_and_constraints([t for t, _ in tables])
+        )
+        cls._sorted_tables_and_constraints = (tables, collection)
+        return collection
+
     @classmethod
     def _load_fixtures(cls):
         """Insert rows as represented by the fixtures() method."""
-        headers, rows = {}, {}
-        for table, data in cls.fixtures().items():
-            if len(data) < 2:
-                continue
-            if isinstance(table, str):
-                table = cls.tables[table]
-            headers[table] = data[0]
-            rows[table] = data[1:]
-        for table, fks in sort_tables_and_constraints(
-            cls._tables_metadata.tables.values()
-        ):
-            if table is None:
-                continue
-            if table not in headers:
-                continue
-            with cls.bind.begin() as conn:
+        tables = cls.tables
+        fixtures = {
+            (tables[table] if isinstance(table, str) else table): data
+            for table, data in cls.fixtures().items()
+            if len(data) >= 2
+        }
+        if not fixtures:
+            return
+
+        with cls.bind.begin() as conn:
+            for table, fks in cls._sort_tables_and_constraints():
+                # also skips the None entry for remaining constraints
+                data = fixtures.get(table)
+                if data is None:
+                    continue
                 conn.execute(
                     table.insert(),
                     [
-                        dict(zip(headers[table], column_values))
-                        for column_values in rows[table]
+                        dict(zip(data[0], column_values))
+                        for column_values in data[1:]
                     ],
                 )
 
 
+def _tables_with_rows(tables, bind):
+    """Return those of the given tables which contain rows, using a
+    single UNION ALL of EXISTS queries.
+
+    """
+    if len(tables) < 2:
+        return tables
+
+    stmt = sa.union_all(
+        *[
+            sa.select(sa.literal_column(str(idx)).label("idx")).where(
+                sa.exists().select_from(table)
+            )
+            for idx, table in enumerate(tables)
+        ]
+    )
+
+    try:
+        with bind.begin() as conn:
+            with_rows = {int(idx) for idx in conn.scalars(stmt)}
+    except sa.exc.DBAPIError as ex:
+        print(
+            ("Error checking tables for rows: %r" % (ex,)),
+            file=sys.stderr,
+        )
+        return tables
+
+    return [table for idx, table in enumerate(tables) if idx in with_rows]
+
+
+# backends which accept "TRUNCATE a, b, c RESTART IDENTITY CASCADE";
+# CockroachDB's TRUNCATE has no RESTART IDENTITY
+_multi_truncate_dialects = {"postgresql"}
+
+
+def _can_batch_truncate(bind):
+    return bind.dialect.name in _multi_truncate_dialects and not (
+        bind.get_execution_options().get("schema_translate_map")
+    )
+
+
+def _batch_truncate(tables, bind):
+    """Delete all rows from the given tables, which are in order of
+    dependent tables first.
+
+    A single TRUNCATE is emitted for all tables where the backend
+    supports it; otherwise, or if the TRUNCATE fails, e.g. as it can't
+    acquire its lock promptly, each table is DELETEd within a single
+    transaction.
+
+    """
+    if not tables:
+        return
+
+    if _can_batch_truncate(bind):
+        try:
+            with bind.begin() as conn:
+                # TRUNCATE waits on any transaction which has read the
+                # tables, same as DROP TABLE; warn about those, and fall
+                # back to DELETE rather than waiting on them
+                engines.testing_reaper.prepare_for_drop_tables(conn)
+                conn.exec_driver_sql("SET LOCAL lock_timeout = '1s'")
+
+                preparer = conn.dialect.identifier_preparer
+                conn.exec_driver_sql(
+                    "TRUNCATE %s RESTART IDENTITY CASCADE"
+                    % ", ".join(preparer.format_table(t) for t in tables)
+                )
+        except sa.exc.DBAPIError as ex:
+            print(
+                ("Error truncating tables: %r" % (ex,)),
+                file=sys.stderr,
+            )
+        else:
+            return
+
+    savepoints = getattr(config.requirements, "savepoints", False)
+    if savepoints:
+        savepoints = savepoints.enabled
+
+    with bind.begin() as conn:
+        for table in tables:
+            try:
+                if savepoints:
+                    with conn.begin_nested():
+                        conn.execute(table.delete())
+                else:
+                    conn.execute(table.delete())
+            except sa.exc.DBAPIError as ex:
+                print(
+                    ("Error emptying table %s: %r" % (table, ex)),
+                    file=sys.stderr,
+                )
+
+
+# backends which accept "DROP TABLE IF EXISTS a, b, c CASCADE"
+_multi_drop_table_dialects = {"postgresql", "mysql", "mariadb", "cockroachdb"}
+
+
+def _batch_drop_tables(metadata, bind):
+    """Drop all tables in the given :class:`.MetaData` using a single
+    DROP TABLE statement, where the backend supports it.
+
+    Falls back to :func:`.drop_all_tables_from_metadata` for other
+    backends, as well as when the tables make use of sequences,
+    DDL event listeners (e.g. PostgreSQL ENUM types), schema translation
+    or unresolvable foreign key cycles, all of which need the full
+    per-table DROP sequence.
+
+    """
+    tables = list(metadata.tables.values())
+
+    if (
+        bind.dialect.name not in _multi_drop_table_dialects
+        or metadata._sequences
+        or metadata.dispatch.before_drop
+        or metadata.dispatch.after_drop
+        or bind.get_execution_options().get("schema_translate_map")
+        or any(t.dispatch.before_drop or t.dispatch.after_drop for t in tables)
+    ):
+        drop_all_tables_from_metadata(metadata, bind)
+        return
+
+    collection = sort_tables_and_constraints(tables)
+    if any(t is None and fkcs for (t, fkcs) in collection):
+        drop_all_tables_from_metadata(metadata, bind)
+        return
+
+    sorted_tables = [t for (t, fkcs) in reversed(collection) if t is not None]
+    if not sorted_tables:
+        return
+
+    def go(connection):
+        engines.testing_reaper.prepare_for_drop_tables(connection)
+
+        preparer = connection.dialect.identifier_preparer
+        connection.exec_driver_sql(
+            "DROP TABLE IF EXISTS %s CASCADE"
+            % ", ".join(preparer.format_table(t) for t in sorted_tables)
+        )
+
+    if not isinstance(bind, sa.engine.Connection):
+        with bind.begin() as connection:
+            go(connection)
+    else:
+        go(bind)
+
+
 class NoCache:
     @config.fixture(autouse=True, scope="function")
     def _disable_cache(self):
@@ -650,9 +944,18 @@ def _close_all_sessions():
     _fixture_sessions.clear()
 
 
+def _clear_mappers():
+    # clear_mappers() visits every registry that is still referenced;
+    # skip it when there's nothing for it to dispose of
+    if not all(
+        mapperlib._is_disposed(reg) for reg in mapperlib._all_registries()
+    ):
+        sa.orm.clear_mappers()
+
+
 def stop_test_class_inside_fixtures(cls):
     _close_all_sessions()
-    sa.orm.clear_mappers()
+    _clear_mappers()
 
 
 def after_test():
@@ -664,6 +967,29 @@ class ORMTest(TestBase):
     pass
 
 
+class _RegisteringBase:
+    """Adds new subclasses to the "classes" registry of the
+    :class:`.MappedTest` currently being set up.
+
+    """
+
+    _cls_registry = None
+
+    def __init_subclass__(cls, **kw) -> None:
+        cls_registry = _RegisteringBase._cls_registry
+        if cls_registry is not None:
+            cls_registry[cls.__name__] = cls
+        super().__init_subclass__(**kw)
+
+
+class _Basic(BasicEntity, _RegisteringBase):
+    pass
+
+
+class _Comparable(ComparableEntity, _RegisteringBase):
+    pass
+
+
 class MappedTest(TablesTest, assertions.AssertsExecutionResults):
     # 'once', 'each', None
     run_setup_classes = "once"
@@ -707,7 +1033,8 @@ class MappedTest(TablesTest, assertions.AssertsExecutionResults):
 
     @classmethod
     def _teardown_once_class(cls):
-        cls.classes.clear()
+        dict.clear(cls.classes)
+        _RegisteringBase._cls_registry = None
 
     @classmethod
     def _setup_once_classes(cls):
@@ -746,22 +1073,12 @@ class MappedTest(TablesTest, assertions.AssertsExecutionResults):
         the "classes" registry.
 
         """
-        cls_registry = cls.classes
-
-        class _Base:
-            def __init_subclass__(cls) -> None:
-                assert cls_registry is not None
-                cls_registry[cls.__name__] = cls
-                super().__init_subclass__()
+        # the registry is left in place after fn() so that classes
+        # declared within test bodies are also registered
+        _RegisteringBase._cls_registry = cls.classes
 
-        class Basic(BasicEntity, _Base):
-            pass
-
-        class Comparable(ComparableEntity, _Base):
-            pass
-
-        cls.Basic = Basic
-        cls.Comparable = Comparable
+        cls.Basic = _Basic
+        cls.Comparable = _Comparable
         fn()
 
     def _teardown_each_mappers(self):
@@ -769,11 +1086,11 @@ class MappedTest(TablesTest, assertions.AssertsExecutionResults):
         # and will define setup_mappers as None -
         # clear mappers in any case
         if self.run_setup_mappers != "once":
-            sa.orm.clear_mappers()
+            _clear_mappers()
 
     def _teardown_each_classes(self):
         if self.run_setup_classes != "once":
-            self.classes.clear()
+            dict.clear(self.classes)
 
     @classmethod
     def setup_classes(cls):
@@ -820,25 +1137,45 @@ class DeclarativeMappedTest(MappedTest):
             cls._tables_metadata.create_all(config.db)
 
 
+# (requirement, column name, expression, test_schema expression,
+# persisted) for the optional columns of ComputedReflectionFixtureTest's
+# computed_column_table
+_computed_columns = (
+    (
+        "computed_columns_virtual",
+        "computed_virtual",
+        "normal + 2",
+        "normal / 2",
+        False,
+    ),
+    (
+        "computed_columns_stored",
+        "computed_stored",
+        "normal - 42",
+        "normal * 42",
+        True,
+    ),
+)
+
+
 class ComputedReflectionFixtureTest(TablesTest):
     run_inserts = run_deletes = None
 
     __backend__ = True
     __requires__ = ("computed_columns", "table_reflection")
 
+    # brackets, quoting and whitespace, removed by normalize(); unlike
+    # the \s of ``regexp``, only ASCII whitespace is removed
+    _normalize_chars = str.maketrans("", "", "[]()`'\" \t\n\r\v\f")
+
+    # no longer used by normalize(); remains for third party suites
     regexp = re.compile(r"[\[\]\(\)\s`'\"]*")
 
     def normalize(self, text):
-        return self.regexp.sub("", text).lower()
+        return text.translate(self._normalize_chars).lower()
 
     @classmethod
     def define_tables(cls, metadata):
-        from .. import Integer
-        from .. import testing
-        from ..schema import Column
-        from ..schema import Computed
-        from ..schema import Table
-
         Table(
             "computed_default_table",
             metadata,
@@ -866,36 +1203,18 @@ class ComputedReflectionFixtureTest(TablesTest):
                 schema=config.test_schema,
             )
 
-        if testing.requires.computed_columns_virtual.enabled:
-            t.append_column(
-                Column(
-                    "computed_virtual",
-                    Integer,
-                    Computed("normal + 2", persisted=False),
-                )
-            )
-            if testing.requires.schemas.enabled:
-                t2.append_column(
-                    Column(
-                        "computed_virtual",
-                        Integer,
-                        Computed("normal / 2", persisted=False),
-                    )
-                )
-        if testing.requires.computed_columns_stored.enabled:
+        for req, name, expr, schema_expr, persisted in _computed_columns:
+            if not getattr(testing.requires, req).enabled:
+                continue
             t.append_column(
-                Column(
-                    "computed_stored",
-                    Integer,
-                    Computed("normal - 42", persisted=True),
-                )
+                Column(name, Integer, Computed(expr, persisted=persisted))
             )
             if testing.requires.schemas.enabled:
                 t2.append_column(
                     Column(
-                        "computed_stored",
+                        name,
                         Integer,
-                        Computed("normal * 42", persisted=True),
+                        Computed(schema_expr, persisted=persisted),
                     )
                 )
 
@@ -0,0 +1,99 @@
+from sqlalchemy import Integer
+from sqlalchemy import literal
+from sqlalchemy import select
+from sqlalchemy import String
+from sqlalchemy import testing
+from sqlalchemy.testing import engines
+from sqlalchemy.testing import eq_
+from sqlalchemy.testing import fixtures
+from sqlalchemy.testing import is_
+from sqlalchemy.testing import is_not
+from sqlalchemy.testing import is_true
+from sqlalchemy.testing.schema import Column
+from sqlalchemy.testing.schema import Table
+
+
+class ClassScopedFixturesTest(fixtures.TestBase):
+    """test the testing_engine_class and metadata_class fixtures."""
+
+    __backend__ = True
+
+    _first_engine = None
+
+    @testing.fixture(scope="class")
+    def class_engine(self, testing_engine_class):
+        return testing_engine_class()
+
+    @testing.fixture(scope="class")
+    def class_table(self, metadata_class):
+        t = Table(
+            "class_fixture_table",
+            metadata_class,
+            Column("id", Integer, primary_key=True),
+            Column("data", String(50)),
+        )
+        metadata_class.create_all(testing.db)
+        with testing.db.begin() as conn:
+            conn.execute(
+                t.insert(), [{"id": 1, "data": "d1"}, {"id": 2, "data": "d2"}]
+            )
+        return t
+
+    @testing.combinations((1,), (2,), argnames="n")
+    def test_engine_shared_by_class(self, class_engine, n):
+        is_not(class_engine, testing.db)
+        is_true(
+            class_engine in engines.testing_reaper.testing_engines["class"]
+        )
+
+        with class_engine.connect() as conn:
+            eq_(conn.scalar(select(literal(n))), n)
+
+        cls = self.__class__
+        if cls._first_engine is None:
+            cls._first_engine = class_engine
+        else:
+            is_(class_engine, cls._first_engine)
+
+    @testing.combinations((1,), (2,), argnames="n")
+    def test_table_shared_by_class(self, class_table, metadata_class, n):
+        is_(class_table.metadata, metadata_class)
+
+        with testing.db.connect() as conn:
+            eq_(
+                conn.scalar(
+                    select(class_table.c.data).where(class_table.c.id == n)
+                ),
+                "d%d" % n,
+            )
+
+
+class DeclarativeCreateEachTest(fixtures.DeclarativeMappedTest):
+    """test run_create_tables="each" where DeclarativeMappedTest has
+    already created the tables at class setup."""
+
+    __backend__ = True
+
+    run_create_tables = "each"
+    run_define_tables = "once"
+    run_setup_mappers = "once"
+
+    @classmethod
+    def setup_classes(cls):
+        Base = cls.DeclarativeBasic
+
+        class A(Base):
+            __tablename__ = "a"
+
+            id = Column(Integer, primary_key=True)
+            data = Column(String(50))
+
+    @testing.combinations((1,), (2,), (3,), argnames="n")
+    def test_tables_created(self, n):
+        A = self.classes.A
+
+        sess = fixtures.fixture_session()
+        sess.add(A(id=n, data="d%d" % n))
+        sess.commit()
+
+        eq_(sess.scalars(select(A.data)).all(), ["d%d" % n])
@@ -35,6 +35,7 @@ from sqlalchemy.orm import relationship
 from sqlalchemy.orm import RelationshipProperty
 from sqlalchemy.orm import Session
 from sqlalchemy.orm import synonym
+from sqlalchemy.orm.mapper import _is_disposed
 from sqlalchemy.orm.persistence import _sort_states
 from sqlalchemy.testing import assert_raises
 from sqlalchemy.testing import assert_raises_message
@@ -3302,6 +3303,17 @@ class RegistryConfigDisposeTest(fixtures.TestBase):
         is_false(B.__mapper__.configured)
         is_false(A.__mapper__.configured)
 
+    def test_is_disposed(self, threeway_configured_fixture):
+        reg1, reg2, reg3 = threeway_configured_fixture
+
+        for reg in (reg1, reg2, reg3):
+            is_false(_is_disposed(reg))
+
+        clear_mappers()
+
+        for reg in (reg1, reg2, reg3):
+            is_true(_is_disposed(reg))
+
     @testing.combinations((True,), (False,), argnames="cascade")
     def test_dispose_cascade_not_on_dependencies(
         self, threeway_configured_fixture, cascade